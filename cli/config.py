@@ -10,37 +10,392 @@ VERSION = "v0.1.0/2025-02-28"
 # Full Documentation:
 # https://github.com/chadkluck/atlantis-cfn-configuration-repo-for-serverless-deployments/
 
-import toml
+import io
 import json
-import yaml
 import re
 import sys
 import os
-import shlex
 import click
 import hashlib
-import argparse
+import functools
+import itertools
 import traceback
+import importlib.util
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
-from botocore.exceptions import ClientError
+from types import SimpleNamespace
+from typing import Dict, Optional, List, Tuple, Union, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+# boto3 (via lib.aws_session), botocore, and the TOML libraries are imported
+# where they are used so that --help and argument errors do not pay for
+# loading them.
 
-from lib.aws_session import AWSSessionManager, TokenRetrievalError
 from lib.logger import ScriptLogger, Log, ConsoleAndLog
 from lib.tools import Colorize
 from lib.atlantis import FileNameListUtils, DefaultsLoader, TagUtils, Utils
 
+def _lazy_import(name: str):
+    """Import a module that is not executed until one of its attributes is first used"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# yaml is only needed once a template is parsed
+yaml = _lazy_import('yaml')
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """Get the libyaml-backed CSafeLoader, or SafeLoader if PyYAML was built without libyaml"""
+    if getattr(yaml, '__with_libyaml__', False):
+        return yaml.CSafeLoader
+    Log.warning("PyYAML is not using libyaml (CSafeLoader unavailable); template parsing will be slower")
+    return yaml.SafeLoader
+
+def yaml_safe_load(text: str):
+    """Safely load YAML text, using the C loader when available"""
+    return yaml.load(text, Loader=_yaml_loader())
+
 if sys.version_info[0] < 3:
     sys.stderr.write("Error: Python 3 is required\n")
     sys.exit(1)
 
-# Initialize logger for this script
-ScriptLogger.setup('config')
-
+# Repository root (the parent of the script's directory), resolved once
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 TEMPLATES_DIR = "local-templates"
 SAMCONFIG_DIR = "samconfigs"
 SETTINGS_DIR = "defaults"
 VALID_INFRA_TYPES = ['service-role', 'pipeline', 'storage', 'network']
+# A service-role stack's project_id must be one of the other infra types
+SERVICE_ROLE_PROJECT_IDS = frozenset(VALID_INFRA_TYPES) - {'service-role'}
+# IAM role ARN in any partition, with an optional path before the role name
+ROLE_ARN_RE = re.compile(r'arn:(?:aws|aws-cn|aws-us-gov|aws-iso|aws-iso-b):iam::\d{12}:role/[\w+=,.@/-]+', re.ASCII)
+# S3 bucket name: 3-63 lowercase letters, numbers, or hyphens, not starting or ending with a hyphen
+S3_BUCKET_RE = re.compile(r'(?=.{3,63}\Z)[a-z0-9][a-z0-9-]*[a-z0-9]', re.DOTALL)
+# Accepted spellings of a boolean prompt answer
+BOOLEAN_VALUES = frozenset({'true', 'false', 'True', 'False', 'TRUE', 'FALSE'})
+# AWS region name such as us-east-1 or us-gov-west-1
+REGION_RE = re.compile(r'[a-z]{2}(?:-[a-z]+)+-[1-9][0-9]*')
+# Order of deployment sections in samconfig files by the first letter of the
+# stage_id (dev, test, beta, stage, prod), then any others in their existing order
+STAGE_SORT_RANK = {'d': 0, 't': 1, 'b': 2, 's': 3, 'p': 4}
+# DeployEnvironment default by the first letter of the stage_id (otherwise 'PROD')
+STAGE_ENVIRONMENTS = {'t': 'TEST', 'd': 'DEV'}
+TEMPLATE_CHUNK_SIZE = 64 * 1024
+# Buffer size for reading local config files (defaults JSON and samconfig TOML)
+CONFIG_READ_BUFFER_SIZE = 32 * 1024
+S3_RANGE_SIZE = 1024 * 1024
+S3_MAX_RANGE_REQUESTS = 16
+# Parameters that may be saved to a defaults file, by section, in prompt order
+POSSIBLE_DEFAULTS = (
+    ('atlantis', ('region', 's3_bucket')),
+    ('parameter_overrides', ('RolePath', 'ServiceRolePath', 'PermissionsBoundaryArn', 'S3BucketNameOrgPrefix', 'ParameterStoreHierarchy')),
+)
+# Environment fallbacks for atlantis deploy parameter prompts, read once at startup
+DEPLOY_PARAM_ENV = {
+    'SAM_DEPLOY_BUCKET': os.getenv('SAM_DEPLOY_BUCKET', ''),
+    'AWS_REGION': os.getenv('AWS_REGION', 'us-east-1'),
+    'SAM_DEPLOY_ROLE': os.getenv('SAM_DEPLOY_ROLE', ''),
+}
+
+# A shell-style word: unquoted text, backslash escapes, and quoted strings
+# with no whitespace between them (e.g. "Key"="Value" or Key=value)
+_WORD_RE = re.compile(r"""(?:[^\s"'\\]+|\\.|"(?:[^"\\]|\\.)*"|'[^']*')+""", re.DOTALL)
+_WORD_PART_RE = re.compile(r""""((?:[^"\\]|\\.)*)"|'([^']*)'|\\(.)""", re.DOTALL)
+_DOUBLE_QUOTED_ESCAPE_RE = re.compile(r'\\([\\"])')
+
+def _unquote_word_part(match: re.Match) -> str:
+    double_quoted, single_quoted, escaped = match.groups()
+    if double_quoted is not None:
+        return _DOUBLE_QUOTED_ESCAPE_RE.sub(r'\1', double_quoted)
+    if single_quoted is not None:
+        return single_quoted
+    return escaped
+
+def split_words(text: str) -> List[str]:
+    """
+    Split a string into words the way shlex.split() does, using precompiled regular expressions.
+
+    Args:
+        text (str): String of space separated words, optionally quoted
+
+    Returns:
+        List[str]: Words with quotes and escapes removed
+
+    Raises:
+        ValueError: If a quote is not closed
+    """
+    words = []
+    pos = 0
+    for match in _WORD_RE.finditer(text):
+        # Anything skipped between words must be whitespace, otherwise a quote was left open
+        gap = text[pos:match.start()]
+        if gap and not gap.isspace():
+            raise ValueError("No closing quotation")
+        words.append(_WORD_PART_RE.sub(_unquote_word_part, match.group()))
+        pos = match.end()
+    if text[pos:].strip():
+        raise ValueError("No closing quotation")
+    return words
+
+@functools.lru_cache(maxsize=128)
+def _parse_parameter_overrides(parameter_string: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse parameter overrides into (key, value) pairs. Use ConfigManager.parse_parameter_overrides()
+
+    Results are cached since the same string is often repeated across the
+    deployment sections of a samconfig file. Tuples are returned so the
+    cached result can't be modified.
+    """
+    parameters: List[Tuple[str, str]] = []
+    
+    if not parameter_string:
+        return ()
+
+    try:
+        # Split the string while preserving quoted values
+        parts = split_words(parameter_string)
+        
+        for part in parts:
+            if '=' in part:
+                key, value = part.split('=', 1)
+                parameters.append((key.strip(), value.strip()))
+            else:
+                Log.warning(f"Skipping invalid parameter format: {part}")
+                
+    except Exception as e:
+        Log.error(f"Error parsing parameter overrides: {str(e)}")
+        
+    return tuple(parameters)
+
+@functools.lru_cache(maxsize=128)
+def _parse_tags(tag_string: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a tag string into (key, value) pairs. Use ConfigManager.parse_tags()
+
+    Results are cached and returned as tuples, like _parse_parameter_overrides().
+    """
+    if not tag_string:
+        return ()
+    
+    tags: List[Tuple[str, str]] = []
+    
+    try:
+        tokens = split_words(tag_string)
+    except ValueError as e:
+        raise ValueError(f"Error parsing quoted strings: {str(e)}")
+
+    try:
+        for token in tokens:
+            if not token:
+                continue
+                
+            # Split on first = only
+            try:
+                key, value = token.split('=', 1)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid tag format. Each tag must be in 'key=value' format: {token}"
+                )
+            
+            # Remove any remaining quotes
+            key = key.strip().strip('"\'')
+            value = value.strip().strip('"\'')
+            
+            if not key or not value:
+                raise ValueError(
+                    f"Empty key or value not allowed: {token}"
+                )
+            
+            tags.append((key, value))
+            
+    except ValueError as e:
+        raise ValueError(f"Error parsing tags: {str(e)}")
+        
+    return tuple(tags)
+
+# Start of the top-level template sections that are parsed, and of any
+# top-level key (a line that doesn't start with a space and ends with ':')
+_TEMPLATE_SECTION_RES = {
+    name: re.compile(rb'^%s:' % name.encode(), re.MULTILINE)
+    for name in ('Parameters', 'Metadata')
+}
+_TEMPLATE_TOP_LEVEL_KEY_RE = re.compile(rb'^(?![ \r\n])[^\n]*:[^\S\n]*$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=512)
+def _compiled_pattern(pattern: str) -> re.Pattern:
+    """Compile a regular expression such as a template's AllowedPattern, reusing earlier compiles"""
+    return re.compile(pattern)
+
+@functools.lru_cache(maxsize=None)
+def _list_local_templates(templates_dir: str) -> Tuple[str, ...]:
+    """List the .yml template file names in a directory (sorted, cached per directory)"""
+    try:
+        with os.scandir(templates_dir) as entries:
+            return tuple(sorted(entry.name for entry in entries if entry.name.endswith('.yml') and entry.is_file()))
+    except FileNotFoundError:
+        return ()
+
+@functools.lru_cache(maxsize=128)
+def _samconfig_file_path(prefix: str, project_id: str, infra_type: str) -> Path:
+    """Build the samconfig file path for a prefix, project, and infra type (cached per combination)"""
+    return Path(os.path.join(BASE_DIR, SAMCONFIG_DIR, prefix, project_id, f"samconfig-{prefix}-{project_id}-{infra_type}.toml"))
+
+def _tags_as_dict(tags: List[Dict]) -> Dict[str, str]:
+    """Convert a [{'Key': ..., 'Value': ...}] tag list to a Key -> Value dict"""
+    return {tag['Key']: tag['Value'] for tag in tags}
+
+# -----------------------------------------------------------------------------
+# - Atlantis deploy parameter prompts
+# -----------------------------------------------------------------------------
+
+_DEPLOY_PARAM_HELP = {
+    's3_bucket': "S3 bucket name for storing deployment artifacts.\n"
+                "Must be 3-63 characters, lowercase, and contain only letters, numbers, or hyphens.",
+    'region': "AWS region where resources will be deployed.\n"
+            "Example: us-east-1, us-west-2, eu-west-1",
+    'confirm_changeset': "Whether to confirm CloudFormation changesets before deployment.\n"
+                        "Enter 'true' or 'false'",
+    'role_arn': "IAM role ARN used for deployments.\n"
+            "Format: arn:aws:iam::account-id:role/role-name"
+}
+
+def _help_box_lines(header: str, text: str) -> List[Dict]:
+    """Split help text into Colorize.box_info lines, with the header on the first line only"""
+    lines = text.split('\n')
+    return [{"header": header, "text": lines[0]}] + [{"header": None, "text": line} for line in lines[1:]]
+
+# Help box lines for each atlantis deploy parameter, built once at import
+_DEPLOY_PARAM_HELP_LINES = {name: _help_box_lines(name, text) for name, text in _DEPLOY_PARAM_HELP.items()}
+
+def _display_deploy_param_help(param_name: str) -> None:
+    """Display help text for atlantis deploy parameters"""
+    help = _DEPLOY_PARAM_HELP_LINES.get(param_name)
+    if help is None:
+        help = _help_box_lines(param_name, "No help available")
+
+    print()
+    Colorize.box_info(help)
+    print()
+
+# Returned by an input command handler to prompt again
+_PROMPT_AGAIN = object()
+
+def _cmd_help(param_name: str, required: bool):
+    """Handle '?': show help for the parameter and prompt again"""
+    _display_deploy_param_help(param_name)
+    return _PROMPT_AGAIN
+
+def _cmd_clear(param_name: str, required: bool):
+    """Handle '-': clear the value unless the parameter is required"""
+    if required:
+        click.echo("\n".join([
+            Colorize.error("This field is required and cannot be cleared"),
+            Colorize.info("Enter ? for help, ^ to exit"),
+        ]))
+        return _PROMPT_AGAIN
+    return ''
+
+def _cmd_exit(param_name: str, required: bool):
+    """Handle '^': exit the script"""
+    click.echo(Colorize.info("\nExiting script..."))
+    sys.exit(0)
+
+# Special input commands and their handlers
+_INPUT_COMMANDS = {
+    '?': _cmd_help,
+    '-': _cmd_clear,
+    '^': _cmd_exit,
+}
+
+def _get_validated_input(prompt, default, validator_func, error_message, param_name, required=False):
+    """Prompt until a valid value is entered. Supports ? for help, - to clear, and ^ to exit"""
+    while True:
+        value = Colorize.prompt(prompt, default, str)
+        
+        # Handle special commands
+        handler = _INPUT_COMMANDS.get(value)
+        if handler is not None:
+            result = handler(param_name, required)
+            if result is _PROMPT_AGAIN:
+                continue
+            return result
+        
+        # Handle empty input when default exists
+        if value == '' and default:
+            value = default
+
+        # Validate input
+        if validator_func(value):
+            return value
+        
+        click.echo("\n".join([
+            "",
+            Colorize.error(f"Invalid value for {param_name}"),
+            Colorize.error(error_message),
+            Colorize.info("Enter ? for help, - to clear, ^ to exit"),
+            "",
+        ]))
+
+# Validation functions
+def _validate_s3_bucket(bucket):
+    return bool(bucket) and S3_BUCKET_RE.fullmatch(bucket) is not None
+
+def _validate_region(region, allowed_regions=None):
+    if allowed_regions is not None:
+        return region in allowed_regions
+    return bool(region) and REGION_RE.fullmatch(region) is not None
+
+def _validate_role_arn(arn):
+    return bool(arn) and ROLE_ARN_RE.fullmatch(arn) is not None
+
+def _validate_boolean(value):
+    # Common spellings are found without lowercasing; mixed case falls back to lower()
+    return value in BOOLEAN_VALUES or value.lower() in BOOLEAN_VALUES
+
+# -----------------------------------------------------------------------------
+# - Stack configuration errors
+# -----------------------------------------------------------------------------
+
+# Each handler returns the console lines for a failed stack configuration lookup
+
+def _stack_config_auth_error(stack_name, error_code, error_message, profile) -> List[str]:
+    return [
+        Colorize.error("Authentication Error"),
+        Colorize.error("Your session token is invalid or has expired"),
+        Colorize.warning("Please authenticate again with AWS and ensure you have the correct permissions"),
+        Colorize.info("You may need to run 'aws sso login' if using AWS SSO"),
+    ]
+
+def _stack_config_missing_error(stack_name, error_code, error_message, profile) -> List[str]:
+    return [Colorize.error(f"Stack '{stack_name}' does not exist")]
+
+def _stack_config_client_error(stack_name, error_code, error_message, profile) -> List[str]:
+    return [
+        Colorize.error(f"Error getting configuration for stack {stack_name}"),
+        Colorize.error(f"Error: {error_code} - {error_message}"),
+        Colorize.warning(f"Ensure you are currently logged in and using the correct profile ({profile})"),
+    ]
+
+def _stack_config_unexpected_error(stack_name, error_code, error_message, profile) -> List[str]:
+    return [
+        Colorize.error(f"Unexpected error getting configuration for stack {stack_name}"),
+        Colorize.error(f"Error: {error_message}"),
+        Colorize.warning("Please check your AWS configuration and try again"),
+    ]
+
+# ClientError codes with specific messages; other codes use _stack_config_client_error
+_STACK_CONFIG_ERROR_HANDLERS = {
+    'UnauthorizedException': _stack_config_auth_error,
+    'ValidationError': _stack_config_missing_error,
+}
 
 class ConfigManager:
     """
@@ -76,6 +431,7 @@ class ConfigManager:
             profile (Optional[str]): AWS credential profile (default: None)
             region (Optional[str]): AWS region
             check_stack (Optional[bool]): Check saved config against deployed stack (default: False)
+            no_browser (Optional[bool]): Use --no-browser for AWS SSO login (default: False)
 
         Raises:
             UsageError: If required arguments are missing or invalid
@@ -93,10 +449,9 @@ class ConfigManager:
         # Check the arguments before moving on
         self._validate_args()
 
-        # Set up AWS session and clients
+        # Set up AWS session (credentials are checked here); clients are created on first use
+        from lib.aws_session import AWSSessionManager
         self.aws_session = AWSSessionManager(profile, region, no_browser)
-        self.s3_client = self.aws_session.get_client('s3', region)
-        self.cfn_client = self.aws_session.get_client('cloudformation', region)
 
         # Initialize template-related attributes
         self.template_version = 'No version found'
@@ -104,6 +459,15 @@ class ConfigManager:
         self.template_hash_id: Optional[str] = None
         self.template_file: Optional[str] = None
 
+        # Last generated stack name and the values it was built from
+        self._stack_name_cache: Optional[Tuple[Tuple, str]] = None
+
+        # DescribeStacks results by stack name, fetched at most once per run
+        self._stack_descriptions: Dict[str, Dict] = {}
+
+        # Float MinValue/MaxValue by id() of the parameter definition
+        self._numeric_bounds_cache: Dict[int, Tuple[Dict, Tuple[float, float]]] = {}
+
         config_loader = DefaultsLoader(
             settings_dir=self.get_settings_dir(),
             prefix=self.prefix,
@@ -114,6 +478,16 @@ class ConfigManager:
         self.settings = config_loader.load_settings()
         self.defaults = config_loader.load_defaults()
 
+    @functools.cached_property
+    def s3_client(self):
+        """S3 client, created the first time a template is read from S3"""
+        return self.aws_session.get_client('s3', self.region)
+
+    @functools.cached_property
+    def cfn_client(self):
+        """CloudFormation client, created the first time a stack is looked up"""
+        return self.aws_session.get_client('cloudformation', self.region)
+
     def _validate_args(self) -> None:
         """Validate arguments"""
 
@@ -122,11 +496,9 @@ class ConfigManager:
             raise click.UsageError(f"Invalid infra_type. Must be one of {VALID_INFRA_TYPES}")
         
         # infra_type service-role requires a project id equal to one of VALID_INFRA_TYPES (except 'service-role')
-        # create temp variable to store VALID_INFRA_TYPES without 'service-role'
-        temp_valid_infra_types = VALID_INFRA_TYPES.copy()
-        temp_valid_infra_types.remove('service-role')
-        if self.infra_type == 'service-role' and self.project_id not in temp_valid_infra_types:
-            raise click.UsageError(f"project_id must be one of {temp_valid_infra_types}")
+        if self.infra_type == 'service-role' and self.project_id not in SERVICE_ROLE_PROJECT_IDS:
+            allowed = [infra_type for infra_type in VALID_INFRA_TYPES if infra_type in SERVICE_ROLE_PROJECT_IDS]
+            raise click.UsageError(f"project_id must be one of {allowed}")
 
 
     def prompt_for_parameters(self, parameter_groups: List, parameters: Dict, defaults: Dict) -> Dict:
@@ -151,10 +523,12 @@ class ConfigManager:
             >>> result = prompt_for_parameters(parameter_groups, parameters, defaults)
         """
 
-        print()
-        click.echo(Colorize.divider())
-        click.echo(Colorize.output_bold("Template Parameter Overrides:"))
-        print()
+        click.echo("\n".join([
+            "",
+            Colorize.divider(),
+            Colorize.output_bold("Template Parameter Overrides:"),
+            "",
+        ]))
         
         values = {}
         
@@ -286,11 +660,13 @@ class ConfigManager:
 
                         break
                     else:
-                        print()
-                        click.echo(Colorize.error(f"Invalid value for {param_name}"))
-                        click.echo(Colorize.error(validation_result.get("reason")))
-                        click.echo(Colorize.info("Enter ? for help, ^ to exit"))
-                        print()
+                        click.echo("\n".join([
+                            "",
+                            Colorize.error(f"Invalid value for {param_name}"),
+                            Colorize.error(validation_result.get("reason")),
+                            Colorize.info("Enter ? for help, ^ to exit"),
+                            "",
+                        ]))
 
         return values
     
@@ -304,13 +680,7 @@ class ConfigManager:
 
         if stage_id is not None:
 
-            envValue = 'PROD'
-            if stage_id.startswith('t'):
-                envValue = 'TEST'
-            elif stage_id.startswith('d'):
-                envValue = 'DEV'
-            
-            defaults['DeployEnvironment'] = envValue
+            defaults['DeployEnvironment'] = STAGE_ENVIRONMENTS.get(stage_id[:1], 'PROD')
 
             # if value is prod, then set RepositoryBranch
             # to 'main' otherwise set to value
@@ -325,110 +695,38 @@ class ConfigManager:
 
     def gather_atlantis_deploy_parameters(self, infra_type: str, atlantis_deploy_parameter_defaults: Dict) -> Dict:
         """Gather atlantis deployment parameters with validation"""
-        print()
-        click.echo(Colorize.divider())
-        click.echo(Colorize.output_bold("Deployment Parameters:"))
-        print()
+        click.echo("\n".join([
+            "",
+            Colorize.divider(),
+            Colorize.output_bold("Deployment Parameters:"),
+            "",
+        ]))
 
         atlantis_deploy_params = {}
-        
-        def display_help(param_name: str) -> None:
-            """Display help text for parameters"""
-            help_text = {
-                's3_bucket': "S3 bucket name for storing deployment artifacts.\n"
-                            "Must be 3-63 characters, lowercase, and contain only letters, numbers, or hyphens.",
-                'region': "AWS region where resources will be deployed.\n"
-                        "Example: us-east-1, us-west-2, eu-west-1",
-                'confirm_changeset': "Whether to confirm CloudFormation changesets before deployment.\n"
-                                    "Enter 'true' or 'false'",
-                'role_arn': "IAM role ARN used for deployments.\n"
-                        "Format: arn:aws:iam::account-id:role/role-name"
-            }
-            text = help_text.get(param_name, "No help available")
-            # split text by \n, then add element at 0 to first List Dict with header as param_name and text[0] as text, then rest with header as None
-            help = [{"header": param_name, "text": text.split('\n')[0]}]
-            for line in text.split('\n')[1:]:
-                help.append({"header": None, "text": line})
-
-            print()
-            Colorize.box_info(help)
-            print()
 
-        def get_validated_input(prompt, default, validator_func, error_message, param_name, required=False):
-            while True:
-                value = Colorize.prompt(prompt, default, str)
-                
-                # Handle special commands
-                if value == '?':
-                    display_help(param_name)
-                    continue
-                elif value == '-':
-                    if required:
-                        click.echo(Colorize.error("This field is required and cannot be cleared"))
-                        click.echo(Colorize.info("Enter ? for help, ^ to exit"))
-                        continue
-                    return ''
-                elif value == '^':
-                    click.echo(Colorize.info("\nExiting script..."))
-                    sys.exit(0)
-                
-                # Handle empty input when default exists
-                if value == '' and default:
-                    value = default
-
-                # Validate input
-                if validator_func(value):
-                    return value
-                
-                print()
-                click.echo(Colorize.error(f"Invalid value for {param_name}"))
-                click.echo(Colorize.error(error_message))
-                click.echo(Colorize.info("Enter ? for help, - to clear, ^ to exit"))
-                print()
-
-        # Validation functions
-        def validate_s3_bucket(bucket):
-            if not bucket:
-                return False
-            if not 3 <= len(bucket) <= 63:
-                return False
-            if not bucket.islower():
-                return False
-            if not all(c.isalnum() or c == '-' for c in bucket):
-                return False
-            if bucket.startswith('-') or bucket.endswith('-'):
-                return False
-            return True
-
-        def validate_region(region):
-            valid_regions = self.settings.get('regions', ['us-east-1'])
-            return region in valid_regions
-
-        def validate_role_arn(arn):
-            if not arn:
-                return False
-            return (arn.startswith('arn:aws:iam::') and 
-                    ':role/' in arn and 
-                    len(arn.split(':')) == 6)
-
-        def validate_boolean(value):
-            return value.lower() in ('true', 'false')
+        # Regions listed in settings.json limit the choices; otherwise accept any
+        # well-formed region name
+        allowed_regions = self.settings.get('regions')
+        validate_region = functools.partial(
+            _validate_region,
+            allowed_regions=frozenset(allowed_regions) if allowed_regions else None
+        )
 
         try:
             # Get S3 bucket with validation (required)
-            atlantis_deploy_params['s3_bucket'] = get_validated_input(
+            atlantis_deploy_params['s3_bucket'] = _get_validated_input(
                 "S3 bucket for deployments",
-                atlantis_deploy_parameter_defaults.get('s3_bucket', os.getenv('SAM_DEPLOY_BUCKET', '')),
-                validate_s3_bucket,
+                atlantis_deploy_parameter_defaults.get('s3_bucket', DEPLOY_PARAM_ENV['SAM_DEPLOY_BUCKET']),
+                _validate_s3_bucket,
                 "Invalid S3 bucket name. Must be 3-63 characters, lowercase, and contain only letters, numbers, or hyphens",
                 's3_bucket',
                 required=True
             )
 
             # Get AWS region with validation (required)
-            atlantis_deploy_params['region'] = get_validated_input(
+            atlantis_deploy_params['region'] = _get_validated_input(
                 "AWS region",
-                atlantis_deploy_parameter_defaults.get('region', os.getenv('AWS_REGION', 'us-east-1')),
+                atlantis_deploy_parameter_defaults.get('region', DEPLOY_PARAM_ENV['AWS_REGION']),
                 validate_region,
                 "Invalid AWS region. Please enter a valid AWS region (e.g., us-east-1)",
                 'region',
@@ -436,10 +734,10 @@ class ConfigManager:
             )
 
             # Confirm changeset prompt with validation
-            atlantis_deploy_params['confirm_changeset'] = get_validated_input(
+            atlantis_deploy_params['confirm_changeset'] = _get_validated_input(
                 "Confirm changeset before deploy",
                 'true' if atlantis_deploy_parameter_defaults.get('confirm_changeset', True) else 'false',
-                validate_boolean,
+                _validate_boolean,
                 "Please enter 'true' or 'false'",
                 'confirm_changeset',
                 required=True
@@ -447,10 +745,10 @@ class ConfigManager:
 
             # Get role ARN if this is a pipeline deployment
             if infra_type == 'pipeline':
-                atlantis_deploy_params['role_arn'] = get_validated_input(
+                atlantis_deploy_params['role_arn'] = _get_validated_input(
                     "IAM role ARN for deployments",
-                    atlantis_deploy_parameter_defaults.get('role_arn', os.getenv('SAM_DEPLOY_ROLE', '')),
-                    validate_role_arn,
+                    atlantis_deploy_parameter_defaults.get('role_arn', DEPLOY_PARAM_ENV['SAM_DEPLOY_ROLE']),
+                    _validate_role_arn,
                     "Invalid role ARN. Must be in format: arn:aws:iam::account-id:role/role-name",
                     'role_arn',
                     required=True
@@ -476,23 +774,24 @@ class ConfigManager:
             # Empty value with default defined is valid
             return {"reason": "Valid", "valid": True}
             
-        param_type = param_def.get('Type', 'String')
+        get = param_def.get
+        param_type = get('Type', 'String')
+        allowed_values = get('AllowedValues')
+        allowed_pattern = get('AllowedPattern')
         
         # Check AllowedValues if defined
-        allowed_values = param_def.get('AllowedValues', [])
         if allowed_values and value not in allowed_values:
             return {"reason": f"Value must be one of: {', '.join(allowed_values)}", "valid": False}
         
         # Check AllowedPattern if defined
-        allowed_pattern = param_def.get('AllowedPattern')
-        if allowed_pattern and not re.match(allowed_pattern, value):
+        if allowed_pattern and not _compiled_pattern(allowed_pattern).fullmatch(value):
             return {"reason": f"Value must match pattern: {allowed_pattern}", "valid": False}
         
         # Type-specific validations
         if param_type in ['String', 'AWS::SSM::Parameter::Value<String>']:
-            min_length = int(param_def.get('MinLength', 0))
+            min_length = int(get('MinLength', 0))
             # Handle MaxLength differently - if not specified, use None instead of infinity
-            max_length = param_def.get('MaxLength')
+            max_length = get('MaxLength')
             if max_length is not None:
                 max_length = int(max_length)
             
@@ -504,8 +803,7 @@ class ConfigManager:
         elif param_type in ['Number', 'AWS::SSM::Parameter::Value<Number>']:
             try:
                 num_value = float(value)
-                min_value = float(param_def.get('MinValue', float('-inf')))
-                max_value = float(param_def.get('MaxValue', float('inf')))
+                min_value, max_value = self._numeric_bounds(param_def)
                 
                 if num_value < min_value:
                     return {"reason": f"Number must be at least {min_value}", "valid": False}
@@ -547,6 +845,33 @@ class ConfigManager:
         
         return {"reason": "Valid", "valid": True}
 
+    def _numeric_bounds(self, param_def: Dict) -> Tuple[float, float]:
+        """Get the MinValue/MaxValue of a numeric parameter definition as floats
+
+        The bounds are converted once per definition and reused for every
+        value checked against it.
+
+        Args:
+            param_def (Dict): CloudFormation parameter definition
+
+        Returns:
+            Tuple[float, float]: (min_value, max_value), unbounded sides are -inf/inf
+
+        Raises:
+            ValueError: If MinValue or MaxValue is not a number
+        """
+        cached = self._numeric_bounds_cache.get(id(param_def))
+        # The definition is kept in the entry so a reused id() is never mistaken for a hit
+        if cached is not None and cached[0] is param_def:
+            return cached[1]
+
+        bounds = (
+            float(param_def.get('MinValue', float('-inf'))),
+            float(param_def.get('MaxValue', float('inf'))),
+        )
+        self._numeric_bounds_cache[id(param_def)] = (param_def, bounds)
+        return bounds
+
     # -------------------------------------------------------------------------
     # - Deployed Stack Utilities
     # -------------------------------------------------------------------------
@@ -588,10 +913,28 @@ class ConfigManager:
         return local_config
 
     def compare_configurations(self, local_config: Dict, stack_config: Dict) -> bool:
-        """Compare local and stack configurations in a list format with color coding"""
+        """Compare local and stack configurations in a list format with color coding
+
+        Args:
+            local_config (Dict): Local samconfig configuration
+            stack_config (Dict): Configuration built from the deployed stack
+
+        Returns:
+            bool: True if any value differs between the two configurations
+        """
         
         differences = False
 
+        # Output is collected here and written with a single echo at the end
+        lines: List[str] = []
+
+        # Bound once as locals since they are used for every compared key
+        add_lines = lines.extend
+        style = click.style
+        output_bold = Colorize.output_bold
+        success_color = Colorize.SUCCESS
+        error_color = Colorize.ERROR
+
         def format_value(value):
             """Convert value to string, handling None/empty values"""
             return str(value) if value is not None else 'None'
@@ -602,12 +945,14 @@ class ConfigManager:
             stack_str = format_value(stack_val)
             
             # Determine color based on whether values match
-            color = Colorize.SUCCESS if local_str == stack_str else Colorize.ERROR
+            color = success_color if local_str == stack_str else error_color
             
-            click.echo(Colorize.output_bold(name))
-            click.echo(click.style(f"  Local: {local_str}", fg=color))
-            click.echo(click.style(f"  Stack: {stack_str}", fg=color))
-            click.echo("")  # Empty line for spacing
+            add_lines((
+                output_bold(name),
+                style(f"  Local: {local_str}", fg=color),
+                style(f"  Stack: {stack_str}", fg=color),
+                "",  # Empty line for spacing
+            ))
 
         # Extract configurations
         local_params = local_config.get('deployments', {}).get(self.stage_id, {}).get('deploy', {}).get('parameters', {})
@@ -627,89 +972,84 @@ class ConfigManager:
             stack_atlantis_params['s3_bucket'] = local_atlantis_params['s3_bucket']
 
         # Convert tags to dictionaries for easier comparison
-        local_tags_dict = {tag['Key']: tag['Value'] for tag in local_tags}
-        stack_tags_dict = {tag['Key']: tag['Value'] for tag in stack_tags}
+        local_tags_dict = _tags_as_dict(local_tags)
+        stack_tags_dict = _tags_as_dict(stack_tags)
 
 
-        # Print Parameter Overrides
-        click.echo(Colorize.divider())
-        click.echo(Colorize.output_bold("Parameter Overrides"))
-        click.echo(Colorize.divider())
-        
-        all_param_keys = sorted(set(local_parameter_overrides.keys()) | set(stack_parameter_overrides.keys()))
-        for key in all_param_keys:
-            local_value = local_parameter_overrides.get(key)
-            stack_value = stack_parameter_overrides.get(key)
-            if local_value != stack_value:
-                differences = True
-            print_comparison(
-                key,
-                local_value,
-                stack_value
-            )
+        # Each section is printed as a divider-wrapped header followed by its keys
+        sections = (
+            ("Parameter Overrides", local_parameter_overrides, stack_parameter_overrides),
+            ("Deploy Parameters", local_atlantis_params, stack_atlantis_params),
+            ("Tags", local_tags_dict, stack_tags_dict),
+        )
 
-        # Print Atlantis Deploy Parameters
-        click.echo(Colorize.divider())
-        click.echo(Colorize.output_bold("Deploy Parameters"))
-        click.echo(Colorize.divider())
-        
-        all_atlantis_keys = sorted(set(local_atlantis_params.keys()) | set(stack_atlantis_params.keys()))
-        for key in all_atlantis_keys:
-            local_value = local_atlantis_params.get(key)
-            stack_value = stack_atlantis_params.get(key)
-            if local_value != stack_value:
-                differences = True
-            print_comparison(
-                key,
-                local_value,
-                stack_value
-            )
+        divider = Colorize.divider()
 
-        # Print Tags
-        click.echo(Colorize.divider())
-        click.echo(Colorize.output_bold("Tags"))
-        click.echo(Colorize.divider())
-        
-        all_tag_keys = sorted(set(local_tags_dict.keys()) | set(stack_tags_dict.keys()))
-        for key in all_tag_keys:
-            local_value = local_tags_dict.get(key)
-            stack_value = stack_tags_dict.get(key)
-            if local_value != stack_value:
-                differences = True
-            print_comparison(
-                key,
-                local_value,
-                stack_value
-            )
+        for title, local_values, stack_values in sections:
+            add_lines((divider, output_bold(title), divider))
+
+            for key in sorted({**local_values, **stack_values}):
+                local_value = local_values.get(key)
+                stack_value = stack_values.get(key)
+                differences |= local_value != stack_value
+                print_comparison(key, local_value, stack_value)
+
+        # click.echo (rather than sys.stdout.write) still strips colors when not on a terminal
+        click.echo("\n".join(lines))
 
         return differences
 
+    def describe_stack(self, stack_name: str) -> Dict:
+        """
+        Get the DescribeStacks description of a single stack.
+
+        The result is cached so each stack is requested from CloudFormation at
+        most once per run. Request rate is limited by the client's adaptive
+        retry mode.
+
+        Args:
+            stack_name (str): Name of the CloudFormation stack
+
+        Returns:
+            Dict: Stack description as returned by DescribeStacks
+
+        Raises:
+            ClientError: If the stack does not exist or cannot be described
+        """
+        if stack_name not in self._stack_descriptions:
+            response = self.cfn_client.describe_stacks(StackName=stack_name)
+            self._stack_descriptions[stack_name] = response['Stacks'][0]
+        return self._stack_descriptions[stack_name]
+
     def get_stack_config(self, stack_name: str) -> Optional[Dict]:
         """Get configuration from existing CloudFormation stack"""
+        from botocore.exceptions import ClientError
+
         try:
-            response = self.cfn_client.describe_stacks(StackName=stack_name)
-            stack = response['Stacks'][0]
+            stack = self.describe_stack(stack_name)
 
-            parameter_overrides = {}
-            tags = stack.get('Tags', [])
+            # Stacks without parameters or tags skip building and scanning them
+            if params := stack.get('Parameters'):
+                parameter_overrides = {param['ParameterKey']: param['ParameterValue'] for param in params}
+            else:
+                parameter_overrides = {}
+            tags = stack.get('Tags') or []
+            # Key -> Value view of the tags for lookups; the list is kept for the config
+            tags_dict = _tags_as_dict(tags)
             atlantis_parameters = {}
 
-            for param in stack.get('Parameters', []):
-                parameter_overrides[param['ParameterKey']] = param['ParameterValue']
-
-            print(stack['StackId'])
+            Log.info(f"Stack ID: {stack['StackId']}")
 
             atlantis_parameters['capabilities'] = ' '.join(stack.get('Capabilities', []))
-            atlantis_parameters['region'] = stack['StackId'].split(':')[3]  # Extract region from stack ID
+            atlantis_parameters['region'] = stack['StackId'].split(':', 4)[3]  # Extract region from stack ID
 
             # Get template file from tags
-            for tag in stack.get('Tags', []):
-                if tag['Key'] == 'atlantis:TemplateFile':
-                    template_file = tag['Value']
-                    # if template_file does not start with s3:// then prepend ./templates/
-                    if not template_file.startswith('s3://'):
-                        template_file = f"./templates/{template_file}"
-                    atlantis_parameters['template_file'] = template_file
+            template_file = tags_dict.get('atlantis:TemplateFile')
+            if template_file is not None:
+                # if template_file does not start with s3:// then prepend ./templates/
+                if not template_file.startswith('s3://'):
+                    template_file = f"./templates/{template_file}"
+                atlantis_parameters['template_file'] = template_file
 
             # place into same format as local_config
             stack_info = {
@@ -728,31 +1068,19 @@ class ConfigManager:
                     
             return stack_info
         
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_message = e.response['Error']['Message']
-            
-            Log.error(f"Error getting configuration for stack {stack_name}: {error_code} - {error_message}")
-            
-            if error_code == 'UnauthorizedException':
-                click.echo(Colorize.error("Authentication Error"))
-                click.echo(Colorize.error("Your session token is invalid or has expired"))
-                click.echo(Colorize.warning("Please authenticate again with AWS and ensure you have the correct permissions"))
-                click.echo(Colorize.info("You may need to run 'aws sso login' if using AWS SSO"))
-            elif error_code == 'ValidationError':
-                click.echo(Colorize.error(f"Stack '{stack_name}' does not exist"))
-            else:
-                click.echo(Colorize.error(f"Error getting configuration for stack {stack_name}"))
-                click.echo(Colorize.error(f"Error: {error_code} - {error_message}"))
-                click.echo(Colorize.warning(f"Ensure you are currently logged in and using the correct profile ({self.profile})"))
-            
-            print()
-            sys.exit(1)
         except Exception as e:
-            Log.error(f"Unexpected error getting configuration for stack {stack_name}: {e}")
-            click.echo(Colorize.error(f"Unexpected error getting configuration for stack {stack_name}"))
-            click.echo(Colorize.error(f"Error: {str(e)}"))
-            click.echo(Colorize.warning("Please check your AWS configuration and try again"))
+            if isinstance(e, ClientError):
+                error_code = e.response['Error']['Code']
+                error_message = e.response['Error']['Message']
+                Log.error(f"Error getting configuration for stack {stack_name}: {error_code} - {error_message}")
+                handler = _STACK_CONFIG_ERROR_HANDLERS.get(error_code, _stack_config_client_error)
+            else:
+                error_code = None
+                error_message = str(e)
+                Log.error(f"Unexpected error getting configuration for stack {stack_name}: {e}")
+                handler = _stack_config_unexpected_error
+
+            click.echo("\n".join(handler(stack_name, error_code, error_message, self.profile)))
             print()
             sys.exit(1)
 
@@ -766,8 +1094,9 @@ class ConfigManager:
         If user chooses no to region, save a blank file as a sample.
         If prefix-defaults.json doesn't exist, offer to save s3_bucket (and region if not saved to defaults)"""
 
-        defaults_path = self.get_settings_dir() / "defaults.json"
-        prefix_defaults_path = self.get_settings_dir() / f"{self.prefix}-defaults.json"
+        settings_dir = self.get_settings_dir()
+        defaults_path = settings_dir / "defaults.json"
+        prefix_defaults_path = settings_dir / f"{self.prefix}-defaults.json"
 
         defaults_data = {}
         prefix_defaults_data = {}
@@ -775,7 +1104,7 @@ class ConfigManager:
         skip = {}
         
         # Create settings directory if it doesn't exist
-        os.makedirs(self.get_settings_dir(), exist_ok=True)
+        settings_dir.mkdir(parents=True, exist_ok=True)
 
         current_params = {
             "atlantis": atlantis.get('deploy', {}).get('parameters', {}),
@@ -833,29 +1162,26 @@ class ConfigManager:
         if scope != 'ALL' and scope != self.prefix:
             scope = 'ALL'
 
-        possible_defaults = [ 
-            {'name': 'atlantis', 'params': ['region', 's3_bucket'] },
-            {'name': 'parameter_overrides', 'params': ['RolePath', 'ServiceRolePath', 'PermissionsBoundaryArn', 'S3BucketNameOrgPrefix', 'ParameterStoreHierarchy'] }
-        ]
+        question = Colorize.question
+        save_question = "Would you like to save this '%s' value as the default choice for '%s' configurations?"
 
-        for section in possible_defaults:
+        for section_name, section_params in POSSIBLE_DEFAULTS:
 
-            section_name = section['name']
-            section_params = section['params']
             curr_deploy_params_for_section = current_params.get(section_name, {})
 
-            for param in section_params:
+            # Only visit params present in the current config, keeping prompt order
+            for param in [param for param in section_params if param in curr_deploy_params_for_section]:
 
                 if section_name in skip and param in skip[section_name]:
                     continue
                 param_is_not_set = True if "" == default_file_data.get(section_name, {}).get(param, "") else False
 
-                if param in curr_deploy_params_for_section and param_is_not_set:
+                if param_is_not_set:
                     if curr_deploy_params_for_section[param]:
                         print()
                         click.echo(Colorize.output_with_value(f"Current {param}:", curr_deploy_params_for_section[param]))
                         save_param = click.confirm(
-                            Colorize.question(f"Would you like to save this '{param}' value as the default choice for '{scope}' configurations?"),
+                            question(save_question % (param, scope)),
                             default=True
                         )
 
@@ -869,20 +1195,14 @@ class ConfigManager:
         
     def read_defaults_file(self, file_path: str) -> Dict:
         """Read in a single defaults file"""
-        if os.path.exists(file_path):
-
-            # read in defaults.json
-            try:
+        # Open directly rather than checking os.path.exists() first; a missing
+        # file is the common case on first run and needs no extra stat()
+        try:
+            with open(file_path, 'r', encoding='utf-8', buffering=CONFIG_READ_BUFFER_SIZE) as f:
                 Log.info(f"Reading {file_path}")
-                with open(file_path, 'r') as f:
-                    defaults_data = json.load(f)
-                return defaults_data
-            except Exception as e:
-                click.echo(Colorize.error(f"Error reading {file_path} {str(e)}"))
-                Log.error(f"Error reading {file_path}: {str(e)}")
-                Log.error(f"Error occurred at:\n{traceback.format_exc()}")
-                return
-        else:
+                defaults_data = json.load(f)
+            return defaults_data
+        except FileNotFoundError:
             Log.info(f"Defaults file does not yet exist: {file_path}")
 
             return {
@@ -890,12 +1210,18 @@ class ConfigManager:
                 "parameter_overrides": {},
                 "tags": []
             }
+        except Exception as e:
+            click.echo(Colorize.error(f"Error reading {file_path} {str(e)}"))
+            Log.error(f"Error reading {file_path}: {str(e)}")
+            Log.error(f"Error occurred at:\n{traceback.format_exc()}")
+            return
     
     def write_defaults_file(self, file_path: str, defaults_data: Dict) -> bool:
         """Write to a defaults file"""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(defaults_data, f, indent=2)
+            # Serialize first so the file is written with a single call
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(defaults_data, indent=2))
             click.echo(Colorize.output(f"Created {file_path}"))
             Log.info(f"Created {file_path}")
             return True
@@ -1060,21 +1386,26 @@ class ConfigManager:
             for tag in original_tags
         }
         
-        # Process custom tags
+        # Process custom tags. New keys are always added; existing keys are
+        # only overridden if they are not reserved Atlantis tags
         for new_tag in new_tags:
             key = new_tag['Key']
-            # Only allow new tags to override if they don't start with atlantis: or Atlantis
-            if key in tag_dict and not (TagUtils.is_atlantis_reserved_tag(key)):
-                tag_dict[key] = new_tag['Value']
-            elif key not in tag_dict:  # Add new custom tags
-                tag_dict[key] = new_tag['Value']
+            if key in tag_dict and TagUtils.is_atlantis_reserved_tag(key):
+                continue
+            tag_dict[key] = new_tag['Value']
         
         # Convert back to list of dictionaries
         return [{'Key': k, 'Value': v} for k, v in tag_dict.items()]
     
     def stringify_tags(self, tags: List[Dict]) -> str:
-        """Convert tags to a string"""
-        return ' '.join([f'"{tag['Key']}"="{tag['Value']}"' for tag in tags])
+        """Convert tags to a string
+
+        Double quotes inside values are escaped so they survive being read back.
+        """
+        return ' '.join(
+            '"%s"="%s"' % (tag['Key'], str(tag['Value']).replace('"', '\\"'))
+            for tag in tags
+        )
     
     def parse_parameter_overrides(self, parameter_string: str) -> Dict:
         """
@@ -1094,31 +1425,12 @@ class ConfigManager:
             Output: {'ParameterKey1': 'value1', 'ParameterKey2': 'value 2'}
         """
  
-        parameters: Dict[str, str] = {}
-        
-        if not parameter_string:
-            return parameters
-
-        try:
-            # Split the string while preserving quoted values
-            parts = shlex.split(parameter_string)
-            
-            for part in parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    parameters[key.strip()] = value.strip()
-                else:
-                    Log.warning(f"Skipping invalid parameter format: {part}")
-                    
-        except Exception as e:
-            Log.error(f"Error parsing parameter overrides: {str(e)}")
-            
-        return parameters
+        return dict(_parse_parameter_overrides(parameter_string))
 
     def parse_tags(self, tag_string: str) -> List[Dict[str, str]]:
         """Convert a string of key-value tag pairs into AWS tag format.
         
-        Uses shlex to properly handle quoted strings, spaces, and special characters
+        Uses shell-style splitting to properly handle quoted strings, spaces, and special characters
         in both keys and values. Supports both single and double quotes.
         
         Args:
@@ -1137,75 +1449,36 @@ class ConfigManager:
             ValueError: If tag_string format is invalid, missing required parts,
                     or contains malformed quotes
         """
-        if not tag_string:
-            return []
-        
-        tags = []
-        lexer = shlex.shlex(tag_string, posix=True)
-        lexer.whitespace_split = True
-        lexer.commenters = ''
-        lexer.wordchars += '=.-/@'  # Allow these chars in unquoted strings
-        
-        try:
-            # Convert iterator to list to handle pairs
-            tokens = list(lexer)
-            
-            # Process tokens in pairs
-            for i in range(0, len(tokens), 1):
-                if not tokens[i]:
-                    continue
-                    
-                # Split on first = only
-                try:
-                    key, value = tokens[i].split('=', 1)
-                except ValueError:
-                    raise ValueError(
-                        f"Invalid tag format. Each tag must be in 'key=value' format: {tokens[i]}"
-                    )
-                
-                # Remove any remaining quotes
-                key = key.strip().strip('"\'')
-                value = value.strip().strip('"\'')
-                
-                if not key or not value:
-                    raise ValueError(
-                        f"Empty key or value not allowed: {tokens[i]}"
-                    )
-                
-                tags.append({
-                    'Key': key,
-                    'Value': value
-                })
-                
-        except ValueError as e:
-            raise ValueError(f"Error parsing tags: {str(e)}")
-        except shlex.Error as e:
-            raise ValueError(f"Error parsing quoted strings: {str(e)}")
-            
-        return tags
+        return [{'Key': key, 'Value': value} for key, value in _parse_tags(tag_string)]
 
     def stringify_parameter_overrides(self, parameter_overrides_as_dict: Dict) -> str:
-        """Convert parameter overrides from dictionary to string"""
+        """Convert parameter overrides from dictionary to string
 
-        parameter_overrides_as_string = " ".join([
-            f'"{key}"="{value}"' for key, value in parameter_overrides_as_dict.items()
-        ])
-        
-        return parameter_overrides_as_string
+        Double quotes inside values are escaped so they survive being read back.
+        """
+
+        return " ".join(
+            '"%s"="%s"' % (key, str(value).replace('"', '\\"'))
+            for key, value in parameter_overrides_as_dict.items()
+        )
 
     # -------------------------------------------------------------------------
     # - Read and Process Templates
     # -------------------------------------------------------------------------
 
-    def read_template_file(self, template_path: str) -> tuple[bytes, str]:
+    def read_template_file(self, template_path: str) -> Tuple[Iterator[bytes], str]:
         """
-        Read template file content from either S3 or local filesystem.
+        Open a template file from either S3 or the local filesystem for streaming.
+
+        The content is returned as an iterator of chunks so it can be hashed
+        as it arrives. Use _hash_and_collect() to consume it.
         
         Args:
             template_path (str): Path to template (s3:// or local path)
             
         Returns:
-            tuple: (file_content as bytes, template_source_path as string)
+            tuple: (iterator of file content chunks as bytes, template_source_path as string)
+                   Local files are returned as a single chunk
         
         Raises:
             Exception: If template cannot be read
@@ -1217,64 +1490,179 @@ class ConfigManager:
                 
                 # Split the key and potential version ID
                 remaining_path = '/'.join(template_path.split('/')[3:])
+                object_args = {'Bucket': bucket_name}
                 if '?' in remaining_path:
                     key, query_string = remaining_path.split('?', 1)
                     if query_string.startswith('versionId='):
-                        version_id = query_string.replace('versionId=', '')
                         # Get object with specific version
-                        response = self.s3_client.get_object(
-                            Bucket=bucket_name,
-                            Key=key,
-                            VersionId=version_id
-                        )
+                        object_args['VersionId'] = query_string.replace('versionId=', '')
                 else:
-                    key = remaining_path
                     # Get latest version of object
-                    response = self.s3_client.get_object(
-                        Bucket=bucket_name,
-                        Key=key
-                    )
+                    key = remaining_path
+                object_args['Key'] = key
                 
-                content = response['Body'].read()
-                return content, template_path
+                return self._read_s3_object(object_args), template_path
 
             else:
                 # Handle local template
                 template_path = self.get_templates_dir() / template_path
+                # Local templates are read in one call and hashed in one pass
                 with open(template_path, "rb") as f:
                     content = f.read()
-                return content, str(template_path)
+                return iter((content,)), str(template_path)
                 
         except (Exception) as e:
             click.echo(Colorize.error(f"Error reading template file {template_path}"))
             Log.error(f"Error reading template file {template_path}: {str(e)}")
             raise
             
-    def process_template_content(self, content: bytes, template_path: str) -> None:
+    def _read_s3_object(self, object_args: Dict) -> Iterator[bytes]:
+        """
+        Get an S3 object, using a multipart transfer for large objects.
+
+        The first S3_RANGE_SIZE bytes are requested up front. If the object is
+        no larger than that it is streamed from that single response, so small
+        templates still take only one request. Otherwise the response is closed
+        and the object is downloaded with boto3's managed transfer, which
+        fetches parts in parallel.
+
+        Args:
+            object_args (Dict): Bucket, Key, and optional VersionId for get_object
+
+        Returns:
+            Iterator[bytes]: Object content chunks
+        """
+        response = self.s3_client.get_object(Range=f"bytes=0-{S3_RANGE_SIZE - 1}", **object_args)
+        content_range = response.get('ContentRange')
+        total_size = int(content_range.rsplit('/', 1)[1]) if content_range else response['ContentLength']
+
+        if total_size <= S3_RANGE_SIZE:
+            return response['Body'].iter_chunks(TEMPLATE_CHUNK_SIZE)
+
+        response['Body'].close()
+
+        from boto3.s3.transfer import TransferConfig
+
+        transfer_config = TransferConfig(
+            multipart_threshold=S3_RANGE_SIZE,
+            multipart_chunksize=S3_RANGE_SIZE,
+            max_concurrency=S3_MAX_RANGE_REQUESTS
+        )
+        extra_args = {'VersionId': object_args['VersionId']} if 'VersionId' in object_args else None
+
+        buffer = io.BytesIO()
+        self.s3_client.download_fileobj(
+            object_args['Bucket'], object_args['Key'], buffer,
+            ExtraArgs=extra_args, Config=transfer_config
+        )
+        return iter((buffer.getvalue(),))
+
+    @staticmethod
+    def _hash_and_collect(chunks: Iterator[bytes]) -> Tuple[bytes, str]:
+        """
+        Calculate the SHA-256 hash of streamed content while collecting it.
+
+        Args:
+            chunks (Iterator[bytes]): Content chunks from read_template_file()
+
+        Returns:
+            tuple: (file_content as bytes, SHA-256 hex digest)
+        """
+        chunks = iter(chunks)
+        first = next(chunks, b'')
+        second = next(chunks, None)
+
+        # Content that arrived whole is hashed in a single call without copying it
+        if second is None:
+            return first, hashlib.sha256(first).hexdigest()
+
+        sha256_hash = hashlib.sha256(first)
+        content = bytearray(first)
+        for chunk in itertools.chain((second,), chunks):
+            sha256_hash.update(chunk)
+            content += chunk
+        return content, sha256_hash.hexdigest()
+
+    @staticmethod
+    def _find_template_version(content: bytes) -> Optional[str]:
+        """
+        Find the value of the first '# Version:' comment at the start of a line.
+
+        Searches the raw bytes and only decodes the matching line.
+
+        Args:
+            content (bytes): Template file content
+
+        Returns:
+            Optional[str]: Version string, or None if there is no version comment
+        """
+        marker = b'# Version:'
+        idx = content.find(marker)
+        while idx != -1:
+            if idx == 0 or content[idx - 1] in b'\r\n':
+                end = content.find(b'\n', idx)
+                if end == -1:
+                    end = len(content)
+                return content[idx + len(marker):end].decode('utf-8').strip()
+            idx = content.find(marker, idx + 1)
+        return None
+
+    @staticmethod
+    def _scan_template(content: bytes) -> Dict:
+        """
+        Pull out the version and the Parameters and Metadata sections of a template.
+
+        Section boundaries are found with byte-level searches and only the
+        text of each section is decoded.
+
+        Args:
+            content (bytes): Template file content
+
+        Returns:
+            Dict: {'version': Optional[str], 'Parameters': str, 'Metadata': str}
+                  Sections that are not present are empty strings
+        """
+        scan = {'version': ConfigManager._find_template_version(content)}
+
+        for name, start_re in _TEMPLATE_SECTION_RES.items():
+            start = start_re.search(content)
+            if start is None:
+                scan[name] = ''
+                continue
+
+            # The section runs until the next top-level key
+            line_end = content.find(b'\n', start.start())
+            end = len(content)
+            if line_end != -1:
+                next_key = _TEMPLATE_TOP_LEVEL_KEY_RE.search(content, line_end + 1)
+                if next_key is not None:
+                    end = next_key.start()
+            scan[name] = content[start.start():end].decode('utf-8').rstrip('\r\n')
+
+        return scan
+
+    def process_template_content(self, content: bytes, template_path: str, full_hash: Optional[str] = None, scan: Optional[Dict] = None) -> None:
         """
         Process template content to extract version and calculate hash.
         
         Args:
             content (bytes): Template file content
             template_path (str): Original template path for logging
+            full_hash (Optional[str]): SHA-256 of content if already calculated
+            scan (Optional[Dict]): Result of _scan_template() if already scanned
         """
 
         try:
-            # Calculate template hash
-            sha256_hash = hashlib.sha256()
-            sha256_hash.update(content)
-            full_hash = sha256_hash.hexdigest()
+            # Calculate template hash if it wasn't calculated while reading
+            if full_hash is None:
+                full_hash = hashlib.sha256(content).hexdigest()
             self.template_hash = full_hash
             self.template_hash_id = full_hash[-6:]
             
             # Extract version from content
-            content_str = content.decode('utf-8')
-            for line in content_str.splitlines():
-                if line.startswith('# Version:'):
-                    self.template_version = line.split(':', 1)[1].strip()
-                    break
-            else:
-                self.template_version = 'No version found'
+            if scan is None:
+                scan = self._scan_template(content)
+            self.template_version = scan['version'] or 'No version found'
             
             # Log template info
             print()
@@ -1288,34 +1676,25 @@ class ConfigManager:
             click.echo(Colorize.error("Error processing template content. Check logs for more info."))
             raise
 
-    def extract_parameter_groups(self, content: bytes) -> List:
+    def extract_parameter_groups(self, content: bytes, scan: Optional[Dict] = None) -> List:
         """
         Extract metadata section from template content and return parameter groups.
 
         Args:
             content (bytes): Template file content
+            scan (Optional[Dict]): Result of _scan_template() if already scanned
 
         Returns:
             Dict: Parameter Groups from metadata section from template
         """
         try:
-            content_str = content.decode('utf-8')
-            metadata_section = ""
-            in_metadata = False
-
-            for line in content_str.splitlines():
-                if line.startswith('Metadata:'):
-                    in_metadata = True
-                    metadata_section = line
-                elif in_metadata:
-                    # Check if we've moved to a new top-level section
-                    if line.strip() and not line.startswith(' ') and line.strip().endswith(':'):
-                        break
-                    metadata_section += '\n' + line
+            if scan is None:
+                scan = self._scan_template(content)
+            metadata_section = scan['Metadata']
 
             # Parse just the Metadata section
             if metadata_section:
-                yaml_content = yaml.safe_load(metadata_section)
+                yaml_content = yaml_safe_load(metadata_section)
                 metadata_section = yaml_content.get('Metadata', {})
                 parameter_groups = metadata_section.get('AWS::CloudFormation::Interface', {}).get('ParameterGroups', [])
                 return parameter_groups
@@ -1326,34 +1705,25 @@ class ConfigManager:
             click.echo(Colorize.error("Error parsing metadata section. Check logs for more info."))
             return []
 
-    def extract_parameters(self, content: bytes) -> Dict:
+    def extract_parameters(self, content: bytes, scan: Optional[Dict] = None) -> Dict:
         """
         Extract parameters section from template content.
         
         Args:
             content (bytes): Template file content
+            scan (Optional[Dict]): Result of _scan_template() if already scanned
             
         Returns:
             Dict: Parameters section from template
         """
         try:
-            content_str = content.decode('utf-8')
-            parameters_section = ""
-            in_parameters = False
-            
-            for line in content_str.splitlines():
-                if line.startswith('Parameters:'):
-                    in_parameters = True
-                    parameters_section = line
-                elif in_parameters:
-                    # Check if we've moved to a new top-level section
-                    if line.strip() and not line.startswith(' ') and line.strip().endswith(':'):
-                        break
-                    parameters_section += '\n' + line
+            if scan is None:
+                scan = self._scan_template(content)
+            parameters_section = scan['Parameters']
             
             # Parse just the Parameters section
             if parameters_section:
-                yaml_content = yaml.safe_load(parameters_section)
+                yaml_content = yaml_safe_load(parameters_section)
                 return yaml_content.get('Parameters', {})
             return {}
             
@@ -1380,16 +1750,20 @@ class ConfigManager:
 
         try:
             # Read template content
-            content, actual_path = self.read_template_file(template_path)
+            chunks, actual_path = self.read_template_file(template_path)
+            content, full_hash = self._hash_and_collect(chunks)
+
+            # Decode once and find the version and sections in one pass
+            scan = self._scan_template(content)
             
             # Process template metadata (version, hash etc)
-            self.process_template_content(content, actual_path)
+            self.process_template_content(content, actual_path, full_hash, scan)
 
             # Extract metadata if present
-            parameter_groups = self.extract_parameter_groups(content)
+            parameter_groups = self.extract_parameter_groups(content, scan)
             
             # Extract and return parameters
-            parameters = self.extract_parameters(content)
+            parameters = self.extract_parameters(content, scan)
             
             return (parameter_groups, parameters)
             
@@ -1432,46 +1806,54 @@ class ConfigManager:
             Logs errors but doesn't raise exceptions
         """
         samconfig_path = self.get_samconfig_file_path()
-        
-        if samconfig_path.exists():
+
+        if not samconfig_path.exists():
+            return None
+
+        try:
+            print()
+            # samconfig_path relative to script
+            samconfig_path_relative = samconfig_path.relative_to(os.getcwd())
+            click.echo(Colorize.output_with_value("Using samconfig file:", samconfig_path_relative))
+            Log.info(f"Using samconfig file: {samconfig_path}")
+            print()
+
+            samconfig_data = {'atlantis': {}, 'deployments': {}}
+            # Use tomllib from stdlib, fallback to tomli for older Python versions
             try:
-                print()
-                # samconfig_path relative to script
-                samconfig_path_relative = samconfig_path.relative_to(os.getcwd())
-                click.echo(Colorize.output_with_value("Using samconfig file:", samconfig_path_relative))
-                Log.info(f"Using samconfig file: {samconfig_path}")
-                print()
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
 
-                samconfig_data = {'atlantis': {}, 'deployments': {}}
-                samconfig = toml.load(samconfig_path)
-                
-                # Handle atlantis deploy parameters section
-                if 'atlantis' in samconfig and isinstance(samconfig['atlantis'], dict):
-                    samconfig_data['atlantis'] = samconfig['atlantis']
-
-                # Handle deployment sections
-                for key, value in samconfig.items():
-                    if key != 'atlantis' and isinstance(value, dict):
-                        try:
-                            deploy_params = value.get('deploy', {}).get('parameters', {})
-                            if isinstance(deploy_params, dict):
-                                parameter_overrides = deploy_params.get('parameter_overrides', '')
-                                if parameter_overrides and isinstance(parameter_overrides, str):
-                                    value['deploy']['parameters']['parameter_overrides'] = self.parse_parameter_overrides(parameter_overrides)
-                                tags = deploy_params.get('tags', '')
-                                if tags and isinstance(tags, str):
-                                    value['deploy']['parameters']['tags'] = self.parse_tags(tags)
-                                samconfig_data['deployments'][key] = value
-                        except (AttributeError, TypeError) as e:
-                            Log.warning(f"Skipping invalid deployment section '{key}': {str(e)}")
-                            continue
-
-                return samconfig_data
-            except Exception as e:
-                Log.error(f"Error reading samconfig file {samconfig_path}: {str(e)}")
-                click.echo(Colorize.error("Error reading samconfig file. Check logs for more info."))
-                return None
-        return None
+            with open(samconfig_path, 'rb', buffering=CONFIG_READ_BUFFER_SIZE) as f:
+                samconfig = tomllib.load(f)
+            
+            # Handle atlantis deploy parameters section
+            if 'atlantis' in samconfig and isinstance(samconfig['atlantis'], dict):
+                samconfig_data['atlantis'] = samconfig['atlantis']
+
+            # Handle deployment sections
+            for key, value in samconfig.items():
+                if key != 'atlantis' and isinstance(value, dict):
+                    try:
+                        deploy_params = value.get('deploy', {}).get('parameters', {})
+                        if isinstance(deploy_params, dict):
+                            parameter_overrides = deploy_params.get('parameter_overrides', '')
+                            if parameter_overrides and isinstance(parameter_overrides, str):
+                                value['deploy']['parameters']['parameter_overrides'] = self.parse_parameter_overrides(parameter_overrides)
+                            tags = deploy_params.get('tags', '')
+                            if tags and isinstance(tags, str):
+                                value['deploy']['parameters']['tags'] = self.parse_tags(tags)
+                            samconfig_data['deployments'][key] = value
+                    except (AttributeError, TypeError) as e:
+                        Log.warning(f"Skipping invalid deployment section '{key}': {str(e)}")
+                        continue
+
+            return samconfig_data
+        except Exception as e:
+            Log.error(f"Error reading samconfig file {samconfig_path}: {str(e)}")
+            click.echo(Colorize.error("Error reading samconfig file. Check logs for more info."))
+            return None
 
     def build_config(self, infra_type: str, template_file: str, atlantis_deploy_parameter_defaults: Dict, parameter_values: Dict, tag_defaults: List, local_config: Dict) -> Dict:
         """Build the complete config dictionary"""
@@ -1517,13 +1899,15 @@ class ConfigManager:
         # If deployments has more than one key then inform the user that multiple deployments were detected, 
         # would they like to update the atlantis deployment parameters across all?
         if len(deployments) > 1:
-            print()
             # Multiple deploy environments detected. Do you want to apply the atlantis deploy parameters to ALL deployments? This will NOT update parameter_overrides or tags for those deployments.
-            click.echo(Colorize.output_with_value("Multiple deploy environments detected for ", f"{prefix}-{project_id}"))
-            click.echo(Colorize.question(f"Do you want to apply the Deploy Parameters to ALL deployments?"))
-            click.echo(Colorize.info(f"(This will NOT update Template Parameter Overrides or Tags for those deployments.)"))
-            click.echo(Colorize.option("Yes or No"))
-            print()
+            click.echo("\n".join([
+                "",
+                Colorize.output_with_value("Multiple deploy environments detected for ", f"{prefix}-{project_id}"),
+                Colorize.question("Do you want to apply the Deploy Parameters to ALL deployments?"),
+                Colorize.info("(This will NOT update Template Parameter Overrides or Tags for those deployments.)"),
+                Colorize.option("Yes or No"),
+                "",
+            ]))
             choice = ""
             # prompt until choice is either y or n
             while choice.upper() not in ['Y', 'N', 'YES', 'NO']:
@@ -1533,8 +1917,8 @@ class ConfigManager:
             print()
             if choice.upper() in ['Y', 'YES']:
                 click.echo(Colorize.output_bold(f"Updating Deploy Parameters across all deployments of {prefix}-{project_id}..."))
-                for deployment in deployments:
-                    deployments[deployment]['deploy']['parameters'].update(atlantis_default_deploy_parameters)
+                for deployment in deployments.values():
+                    deployment['deploy']['parameters'].update(atlantis_default_deploy_parameters)
             else:
                 click.echo(Colorize.output_bold(f"Updating Deploy Parameters only for {stage_id}..."))
                 # We do this below so we'll skip doing it here
@@ -1542,13 +1926,13 @@ class ConfigManager:
         # We will now apply the deploy parameters to the deployment
         # We already applied the atlantis_default_deploy_parameters above but now
         # we focus on just the current stage
-        deployment_parameters = atlantis_default_deploy_parameters.copy()
-        deployment_parameters.update({
+        deployment_parameters = {
+            **atlantis_default_deploy_parameters,
             'stack_name': stack_name,
             's3_prefix': stack_name,
             'parameter_overrides': parameter_values,
             'tags': tags
-        })
+        }
 
         deployments[stage_id] = {
             'deploy': {
@@ -1583,6 +1967,7 @@ class ConfigManager:
 
     def save_config(self, config: Dict) -> None:
         """Save configuration to samconfig.toml file"""
+        import tomlkit
 
         try:
             # Get the parameter values from the config
@@ -1614,7 +1999,7 @@ class ConfigManager:
 
             non_atlantis_deploy_sections = {}
             # Reorder the deployments to place default first, then those starting with t, b, s, and finally p
-            for stage_id in sorted(config.get('deployments', {}), key=lambda x: (x[0] != 'd', x[0] != 't', x[0] != 'b', x[0] != 's', x[0] != 'p')):
+            for stage_id in sorted(config.get('deployments', {}), key=lambda x: STAGE_SORT_RANK.get(x[:1], len(STAGE_SORT_RANK))):
                 non_atlantis_deploy_sections[stage_id] = config['deployments'][stage_id]
                         
             # Write the config to samconfig.toml
@@ -1623,49 +2008,53 @@ class ConfigManager:
             # Create the samconfig directory if it doesn't exist
             os.makedirs(os.path.dirname(samconfig_path), exist_ok=True)
             
-            with open(samconfig_path, 'w') as f:
-                f.write(header)
-                toml.dump(atlantis_deploy_section, f)
-                    
-                for section, section_config in non_atlantis_deploy_sections.items():
+            # Build the whole file in memory and write it with a single call
+            buf = io.StringIO()
+            buf.write(header)
+            tomlkit.dump(atlantis_deploy_section, buf)
+                
+            for section, section_config in non_atlantis_deploy_sections.items():
 
-                    section_pystr = f"{pystr}"
-                    if section != 'default':
-                        section_pystr += f" {section}"
+                section_pystr = f"{pystr}"
+                if section != 'default':
+                    section_pystr += f" {section}"
 
-                    section_deploy_command = ""
-                    if self.template_file.startswith('s3://'):
-                        section_deploy_command += "# Since template is in S3 you MUST use the python deploy script:\n"
-                        section_deploy_command += f"# {self.get_script_deploy_command(section)}"
-                    else:
-                        section_deploy_command += f"# {self.get_sam_deploy_command(section)}\n# -- OR --\n"
-                        section_deploy_command += f"# {self.get_script_deploy_command(section)}\n"
+                section_deploy_command = ""
+                if self.template_file.startswith('s3://'):
+                    section_deploy_command += "# Since template is in S3 you MUST use the python deploy script:\n"
+                    section_deploy_command += f"# {self.get_script_deploy_command(section)}"
+                else:
+                    section_deploy_command += f"# {self.get_sam_deploy_command(section)}\n# -- OR --\n"
+                    section_deploy_command += f"# {self.get_script_deploy_command(section)}\n"
+                
+                deploy_section_header = (
+                    '# =====================================================\n'
+                    f'# {section} Deployment Configuration\n\n'
+                    '# Deploy command:\n'
+                    f'{section_deploy_command}\n\n'
+                    '# Do not update this file!\n'
+                    '# To update parameter_overrides or tags for this deployment, use the generate script:\n'
+                    f'# python3 {section_pystr}\n'
+                )
+
+                # Convert parameter_values dict to parameter_overrides string
+                p_overrides = section_config.get('deploy', {}).get('parameters', {}).get('parameter_overrides', '')
+                if isinstance(p_overrides, dict):
+                    parameter_overrides = self.stringify_parameter_overrides(p_overrides)
                     
-                    deploy_section_header = (
-                        '# =====================================================\n'
-                        f'# {section} Deployment Configuration\n\n'
-                        '# Deploy command:\n'
-                        f'{section_deploy_command}\n\n'
-                        '# Do not update this file!\n'
-                        '# To update parameter_overrides or tags for this deployment, use the generate script:\n'
-                        f'# python3 {section_pystr}\n'
-                    )
+                    # Update the config with the string version
+                    section_config['deploy']['parameters']['parameter_overrides'] = parameter_overrides
 
-                    # Convert parameter_values dict to parameter_overrides string
-                    p_overrides = section_config.get('deploy', {}).get('parameters', {}).get('parameter_overrides', '')
-                    if isinstance(p_overrides, dict):
-                        parameter_overrides = self.stringify_parameter_overrides(p_overrides)
-                        
-                        # Update the config with the string version
-                        section_config['deploy']['parameters']['parameter_overrides'] = parameter_overrides
+                tags = section_config.get('deploy', {}).get('parameters', {}).get('tags', '')
+                if isinstance(tags, list):
+                    # Update the config with the string version
+                    section_config['deploy']['parameters']['tags'] = self.stringify_tags(tags)
+                
+                buf.write(f'\n{deploy_section_header}\n')
+                tomlkit.dump({section: section_config}, buf)
 
-                    tags = section_config.get('deploy', {}).get('parameters', {}).get('tags', '')
-                    if isinstance(tags, list):
-                        # Update the config with the string version
-                        section_config['deploy']['parameters']['tags'] = self.stringify_tags(tags)
-                    
-                    f.write(f'\n{deploy_section_header}\n')
-                    toml.dump({section: section_config}, f)
+            with open(samconfig_path, 'w') as f:
+                f.write(buf.getvalue())
                 
             Log.info(f"Configuration saved to '{samconfig_path}'")
 
@@ -1782,7 +2171,7 @@ class ConfigManager:
     def discover_local_templates(self) -> List[str]:
         """Discover available templates in the infrastructure type directory"""
         Log.info(f"Discovering templates from local directory: {self.get_templates_dir()}")
-        return [f.name for f in self.get_templates_dir().glob('*.yml')]
+        return list(_list_local_templates(str(self.get_templates_dir())))
 
     def discover_s3_templates(self) -> List[str]:
         """Discover available templates in the infrastructure type directory"""
@@ -1926,26 +2315,25 @@ class ConfigManager:
                  Note: stage_id is optional in the pattern
         """
 
+        # prefix, project_id, and stage_id can be changed while prompting for
+        # parameters, so the cached name is only reused if they still match
+        key = (self.prefix, self.project_id, self.stage_id, self.infra_type)
+        if self._stack_name_cache is not None and self._stack_name_cache[0] == key:
+            return self._stack_name_cache[1]
+
         # We capitalize the prefix of service-roles as they are special and can be used to provide permissions
         prefix = self.prefix.upper() if self.infra_type == 'service-role' else self.prefix
 
-        stack_name = f"{prefix}-"
-
-        if self.project_id:
-            stack_name += f"{self.project_id}-"
-        
-        if  self.stage_id and self.stage_id != 'default':
-            stack_name += f"{self.stage_id}-"
-
-        stack_name += f"{self.infra_type}"
+        project_id = f"{self.project_id}-" if self.project_id else ""
+        stage_id = f"{self.stage_id}-" if self.stage_id and self.stage_id != 'default' else ""
 
+        stack_name = f"{prefix}-{project_id}{stage_id}{self.infra_type}"
+        self._stack_name_cache = (key, stack_name)
         return stack_name
     
     def get_samconfig_dir(self) -> Path:
         """Get the samconfig directory path"""
-        # Get the script's directory in a cross-platform way
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SAMCONFIG_DIR / self.prefix / self.project_id 
+        return Path(os.path.join(BASE_DIR, SAMCONFIG_DIR, self.prefix, self.project_id))
     
     def get_samconfig_file_name(self) -> str:
         """Get the samconfig file name"""
@@ -1953,19 +2341,15 @@ class ConfigManager:
     
     def get_samconfig_file_path(self) -> Path:
         """Get the samconfig file path"""
-        return self.get_samconfig_dir() / self.get_samconfig_file_name()
+        return _samconfig_file_path(self.prefix, self.project_id, self.infra_type)
 
     def get_settings_dir(self) -> Path:
         """Get the settings directory path"""
-        # Get the script's directory in a cross-platform way
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / SETTINGS_DIR
+        return Path(os.path.join(BASE_DIR, SETTINGS_DIR))
         
     def get_templates_dir(self) -> Path:
         """Get the settings directory path"""
-        # Get the script's directory in a cross-platform way
-        script_dir = Path(__file__).resolve().parent
-        return script_dir.parent / TEMPLATES_DIR / self.infra_type
+        return Path(os.path.join(BASE_DIR, TEMPLATES_DIR, self.infra_type))
 
     # -------------------------------------------------------------------------
     # - Internal Utilities
@@ -2003,7 +2387,71 @@ Examples:
         For an AWS SSO login session, whether or not to set the --no-browser flag.        
 """
 
-def parse_args() -> argparse.Namespace:
+# Options that take a value and flags that are on when present. These must
+# stay in sync with the arguments defined in parse_args()
+FAST_PARSE_OPTIONS = ('profile', 'region')
+FAST_PARSE_FLAGS = ('check_stack', 'no_browser')
+
+def fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common invocations without loading argparse
+
+    Only handles a valid infra type followed by 3 or 4 positional arguments
+    and the known options and flags spelled out in full. Anything else,
+    including help, abbreviations, and errors, returns None so that
+    argparse can handle it and report usage.
+
+    Args:
+        argv (List[str]): Command line arguments without the script name
+
+    Returns:
+        Optional[SimpleNamespace]: Parsed arguments, or None if argparse is needed
+    """
+    values = dict.fromkeys(FAST_PARSE_OPTIONS)
+    values.update(dict.fromkeys(FAST_PARSE_FLAGS, False))
+    positionals = []
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if not arg.startswith('-'):
+            positionals.append(arg)
+            continue
+
+        name, sep, value = arg[2:].partition('=')
+        if not arg.startswith('--') or not name or '_' in name:
+            return None
+        name = name.replace('-', '_')
+        if name in FAST_PARSE_FLAGS and not sep:
+            values[name] = True
+        elif name in FAST_PARSE_OPTIONS:
+            if not sep:
+                if i >= len(argv) or argv[i].startswith('-'):
+                    return None
+                value = argv[i]
+                i += 1
+            values[name] = value
+        else:
+            return None
+
+    if len(positionals) not in (3, 4) or positionals[0] not in VALID_INFRA_TYPES:
+        return None
+
+    positionals.append(None)
+    values.update(zip(('infra_type', 'prefix', 'project_id', 'stage_id'), positionals))
+    return SimpleNamespace(**values)
+
+def parse_args(argv: Optional[List[str]] = None) -> Union[SimpleNamespace, 'argparse.Namespace']:
+    """Parse command line arguments (defaults to sys.argv[1:])"""
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = fast_parse_args(argv)
+    if args is not None:
+        return args
+
+    import argparse
 
     parser = argparse.ArgumentParser(
         description='Create, Update, and Manage AWS samconfig for stack deployments',
@@ -2048,14 +2496,23 @@ def parse_args() -> argparse.Namespace:
                         default=False,        # Default value when flag is not used
                         help='For an AWS SSO login session, whether or not to set the --no-browser flag.')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
         
     return args
 
 def main():
     
+    # Parse arguments before any other setup so that --help and usage
+    # errors exit without creating log files or loading AWS libraries.
+    # This relies on lib/__init__.py not importing aws_session (boto3) eagerly.
+    args = parse_args()
+
+    # Initialize logger for this script
+    ScriptLogger.setup('config')
+
     try:
-        args = parse_args()
+        from lib.aws_session import TokenRetrievalError
+
         Log.info(f"{sys.argv}")
         Log.info(f"Version: {VERSION}")
         
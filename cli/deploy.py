@@ -16,11 +16,16 @@ import tempfile
 import subprocess
 import argparse
 import traceback
-import tomli  # Make sure to pip install tomli
 from pathlib import Path
 from typing import Optional
 from botocore.exceptions import ClientError
 
+# Use tomllib from stdlib, fallback to tomli for older Python versions
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # Make sure to pip install tomli
+
 from lib.aws_session import AWSSessionManager
 from lib.logger import ScriptLogger, ConsoleAndLog, Log
 
@@ -68,7 +73,7 @@ class TemplateDeployer:
         try:
             config_file = self.get_samconfig_file_path()
             with open(config_file, 'rb') as f:
-                config = tomli.load(f)
+                config = tomllib.load(f)
             
             # Look for template parameter in stage-specific section
             template_param = config.get('default', {}).get('deploy', {}).get('parameters', {}).get('template_file')
@@ -84,7 +89,7 @@ class TemplateDeployer:
             
         except FileNotFoundError:
             raise ValueError(f"Config file not found: {config_path}")
-        except tomli.TOMLDecodeError as e:
+        except tomllib.TOMLDecodeError as e:
             raise ValueError(f"Invalid TOML format in config file: {str(e)}")
 
     def parse_s3_url(self, s3_url: str) -> tuple[str, str, Optional[str]]:
@@ -71,7 +71,7 @@ class ConfigImporter:
             self.capabilities = stack.get('Capabilities', [])
             
             if self.region is None:
-                self.region = stack['StackId'].split(':')[3]
+                self.region = stack['StackId'].split(':', 4)[3]
                         
             return {
                 'parameters': self.parameters,
@@ -1,4 +1,3 @@
-from .aws_session import AWSSessionManager
 from .logger import ScriptLogger, ConsoleAndLog, Log
 from .tools import Strings, Colorize
 from .atlantis import FileNameListUtils, DefaultsLoader, TagUtils
@@ -14,3 +13,10 @@ __all__ = [
 	'DefaultsLoader',
 	'TagUtils'
 ]
+
+def __getattr__(name):
+    # aws_session imports boto3, so it is only loaded when AWSSessionManager is used
+    if name == 'AWSSessionManager':
+        from .aws_session import AWSSessionManager
+        return AWSSessionManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,19 @@ VERSION = "v0.1.0/2025-02-28"
 Tools specific to Atlantis cli
 """
 
+import os
 import json
 from pathlib import Path
 from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
+# orjson is optional and used in place of the json module when installed (None otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import click
 
 from .logger import Log, ConsoleAndLog
@@ -21,6 +29,12 @@ from .tools import Colorize, Strings
 # - Tag Utilities
 # -------------------------------------------------------------------------
 
+# Tags set by Atlantis that users may not override
+ATLANTIS_RESERVED_TAG_PREFIXES = ('Atlantis', 'atlantis:')
+ATLANTIS_RESERVED_TAG_KEYS = frozenset({'Provisioner', 'DeployedUsing', 'Name', 'Stage', 'Environment', 'AlarmNotificationEmail'})
+
+# AWS allows letters, numbers, spaces, and the following special characters in tags: + - = . _ : / @
+AWS_TAG_ALLOWED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 +-=._:/@")
 
 class TagUtils:
 
@@ -46,16 +60,15 @@ class TagUtils:
         if value.startswith(" ") or value.endswith(" "):
             return False, "Tag values cannot start or end with spaces"
         
-        if key.startswith('Atlantis') or key.startswith('atlantis:'):
+        if key.startswith(ATLANTIS_RESERVED_TAG_PREFIXES):
             return False, "Tag key cannot start with 'Atlantis' or 'atlantis:'"
         
         if TagUtils.is_atlantis_reserved_tag(key):
             return False, f"Tag key '{key}' is a reserved Atlantis tag"
         
-        # AWS allows letters, numbers, spaces, and the following special characters: + - = . _ : / @
-        allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 +-=._:/@")
-        invalid_chars = set(key) - allowed_chars
-        if invalid_chars:
+        # Only build the set of offending characters when the key is invalid
+        if not AWS_TAG_ALLOWED_CHARS.issuperset(key):
+            invalid_chars = set(key) - AWS_TAG_ALLOWED_CHARS
             return False, f"Tag key contains invalid characters: {', '.join(invalid_chars)}"
         
         # Value validation
@@ -64,9 +77,8 @@ class TagUtils:
         if not value.strip():
             return False, "Tag value cannot be empty"
         
-        # AWS allows letters, numbers, spaces, and the following special characters: + - = . _ : / @
-        invalid_chars = set(value) - allowed_chars
-        if invalid_chars:
+        if not AWS_TAG_ALLOWED_CHARS.issuperset(value):
+            invalid_chars = set(value) - AWS_TAG_ALLOWED_CHARS
             return False, f"Tag value contains invalid characters: {', '.join(invalid_chars)}"
         
         return True, ""
@@ -81,7 +93,7 @@ class TagUtils:
         Returns:
             bool: True if the tag key is not a reserved Atlantis tag
         """
-        return (key.startswith('Atlantis') or key.startswith('atlantis:') or key in ['Provisioner', 'DeployedUsing', 'Name', 'Stage', 'Environment', 'AlarmNotificationEmail'])
+        return key.startswith(ATLANTIS_RESERVED_TAG_PREFIXES) or key in ATLANTIS_RESERVED_TAG_KEYS
 
     @staticmethod
     def prompt_for_tags(tags: Dict) -> Dict:
@@ -441,17 +453,59 @@ class DefaultsLoader:
         return self.settings_dir
 
     def _deep_update(self, base_dict: Dict, update_dict: Dict) -> None:
-        """Recursively update a dictionary
+        """Deep update a dictionary, merging nested dictionaries
+        
+        Nested levels are handled with an explicit stack rather than recursion.
+        Values that are not both dictionaries (including lists) are replaced.
         
         Args:
             base_dict (Dict): Base dictionary to update
             update_dict (Dict): Dictionary with updates to apply
         """
-        for key, value in update_dict.items():
-            if isinstance(value, dict) and key in base_dict and isinstance(base_dict[key], dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                current = base.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
+
+    @staticmethod
+    def _read_json(file_path: Path):
+        """Read and parse a JSON file, using orjson when it is installed
+        
+        Args:
+            file_path (Path): JSON file to read
+            
+        Returns:
+            Parsed JSON data
+            
+        Raises:
+            JSONDecodeError: If the file contains invalid JSON
+        """
+        if orjson is not None:
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+            return orjson.loads(file_path.read_bytes())
+        with open(file_path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _list_file_names(directory: Path) -> set:
+        """Get the names of the entries in a directory
+        
+        Args:
+            directory (Path): Directory to list
+            
+        Returns:
+            set: Entry names, or an empty set if the directory doesn't exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
 
     def load_settings(self) -> Dict:
         """Load settings.json
@@ -502,38 +556,49 @@ class DefaultsLoader:
             Dict: Merged configuration dictionary
         """
         defaults = {}
+        settings_dir = self.get_settings_dir()
+        infra_dir = settings_dir / f"{self.infra_type}"
         
         # Define the sequence of potential config files
         config_files = [
-            self.get_settings_dir() / "defaults.json",
-            self.get_settings_dir() / f"{self.prefix}-defaults.json"
+            (settings_dir, "defaults.json"),
+            (settings_dir, f"{self.prefix}-defaults.json")
         ]
         
         # Add project_id specific files only if project_id exists
         if self.project_id:
-            config_files.extend([
-                self.get_settings_dir() / f"{self.prefix}-{self.project_id}-defaults.json",
-            ])
+            config_files.append((settings_dir, f"{self.prefix}-{self.project_id}-defaults.json"))
         
         # Add infra_type specific files
-        config_files.append(self.get_settings_dir() / f"{self.infra_type}" / "defaults.json")
-        config_files.append(self.get_settings_dir() / f"{self.infra_type}" / f"{self.prefix}-defaults.json")
+        config_files.append((infra_dir, "defaults.json"))
+        config_files.append((infra_dir, f"{self.prefix}-defaults.json"))
         
         # Add project_id specific files in infra_type directory
         if self.project_id:
-            config_files.append(
-                self.get_settings_dir() / f"{self.infra_type}" / f"{self.prefix}-{self.project_id}-defaults.json"
-            )
+            config_files.append((infra_dir, f"{self.prefix}-{self.project_id}-defaults.json"))
+
+        # List each directory once instead of checking every file
+        present = {directory: self._list_file_names(directory) for directory in (settings_dir, infra_dir)}
         
-        # Load each config file in sequence if it exists
-        for config_file in config_files:
+        existing_files = [
+            directory / file_name
+            for directory, file_name in config_files
+            if file_name in present[directory]
+        ]
+
+        # Read and parse the files concurrently, then merge them in order
+        if len(existing_files) > 1:
+            with ThreadPoolExecutor(max_workers=len(existing_files)) as executor:
+                futures = [executor.submit(self._read_json, config_file) for config_file in existing_files]
+        else:
+            futures = None
+
+        for i, config_file in enumerate(existing_files):
             try:
-                if config_file.exists():
-                    with open(config_file) as f:
-                        # Deep update defaults with new values
-                        new_config = json.load(f)
-                        self._deep_update(defaults, new_config)
-                        Log.info(f"Loaded config from '{config_file}'")
+                new_config = futures[i].result() if futures else self._read_json(config_file)
+                # Deep update defaults with new values
+                self._deep_update(defaults, new_config)
+                Log.info(f"Loaded config from '{config_file}'")
             except json.JSONDecodeError as e:
                 Log.error(f"Error parsing JSON from {config_file}: {e}")
             except Exception as e:
@@ -26,10 +26,16 @@ import configparser
 import time
 import boto3
 from typing import Optional, Any
+from botocore.config import Config
 from botocore.exceptions import ClientError, TokenRetrievalError
 
 from lib.logger import ConsoleAndLog
 
+# Adaptive retry mode adds client-side rate limiting on top of exponential
+# backoff so throttled APIs (such as CloudFormation DescribeStacks) recover
+# without a burst of failed retries
+CLIENT_CONFIG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'})
+
 class TokenRetrievalError(Exception):
     """Custom exception for AWS token retrieval failures"""
     pass
@@ -40,6 +46,7 @@ class AWSSessionManager:
         self.region = region
         self.session = None
         self.no_browser = no_browser
+        self._clients = {}
         self.refresh_credentials()
 
     def refresh_credentials(self) -> None:
@@ -54,11 +61,11 @@ class AWSSessionManager:
         while retry_count < max_retries:
             try:
                 # First try to create a session with existing credentials
-                self.session = boto3.Session(profile_name=self.profile)
+                self._new_session()
                 
                 # Test if credentials are valid using STS
                 try:
-                    sts = self.session.client('sts')
+                    sts = self.get_client('sts')
                     sts.get_caller_identity()
                     ConsoleAndLog.info("Using existing valid credentials")
                     print()
@@ -72,9 +79,9 @@ class AWSSessionManager:
                             ConsoleAndLog.info("Token expired. Initiating SSO login...")
                             self._refresh_sso_login()
                             # Create new session after SSO login
-                            self.session = boto3.Session(profile_name=self.profile)
+                            self._new_session()
                             # Verify the new session
-                            sts = self.session.client('sts')
+                            sts = self.get_client('sts')
                             sts.get_caller_identity()
                             ConsoleAndLog.info("Successfully refreshed SSO credentials")
                             return
@@ -91,8 +98,8 @@ class AWSSessionManager:
                     ConsoleAndLog.info("Token expired. Initiating SSO login...")
                     try:
                         self._refresh_sso_login()
-                        self.session = boto3.Session(profile_name=self.profile)
-                        sts = self.session.client('sts')
+                        self._new_session()
+                        sts = self.get_client('sts')
                         sts.get_caller_identity()
                         ConsoleAndLog.info("Successfully refreshed SSO credentials")
                         return
@@ -257,17 +264,33 @@ class AWSSessionManager:
             raise TokenRetrievalError(error_msg)
 
 
+    def _new_session(self) -> None:
+        """Create a new boto3 session for the profile and drop clients from the previous one
+
+        All clients are created from this one session so they share its
+        botocore loader, service model cache, and endpoint resolver.
+        """
+        self.session = boto3.Session(profile_name=self.profile)
+        self._clients = {}
+
     def get_session(self) -> boto3.Session:
         """Get the current boto3 session"""
         return self.session
 
     def get_client(self, service_name: str, region: Optional[str] = None) -> Any:
-        """Get a boto3 client for the specified service"""
+        """Get a boto3 client for the specified service
+        
+        Clients are created once per service and region and reused, since
+        creating a client loads and parses the service model.
+        """
         if not self.session:
             raise ValueError("No valid session available")
         if not region:
             region = self.region
-        return self.session.client(service_name, region)
+        key = (service_name, region)
+        if key not in self._clients:
+            self._clients[key] = self.session.client(service_name, region, config=CLIENT_CONFIG)
+        return self._clients[key]
 
     def _can_open_browser(self) -> bool:
         """Check if the current environment can open a browser"""